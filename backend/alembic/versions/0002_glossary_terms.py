@@ -0,0 +1,29 @@
+"""glossary terms
+
+Revision ID: 0002_glossary_terms
+Revises: 0001_init
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002_glossary_terms"
+down_revision = "0001_init"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_table(
+        "glossary_terms",
+        sa.Column("id", sa.Uuid(), primary_key=True),
+        sa.Column("user_id", sa.Uuid(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("source_term", sa.String(length=255), nullable=False),
+        sa.Column("target_term", sa.String(length=255), nullable=False),
+        sa.Column("note", sa.String(length=255), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+        sa.UniqueConstraint("user_id", "source_term", name="uq_glossary_terms_user_source"),
+    )
+    op.create_index("ix_glossary_terms_user_id", "glossary_terms", ["user_id"])
+
+def downgrade():
+    op.drop_table("glossary_terms")
@@ -0,0 +1,134 @@
+"""partition credit_ledger and discovery_searches by month
+
+Revision ID: 0003_partition_ledger_searches
+Revises: 0002_glossary_terms
+Create Date: 2026-10-19
+"""
+from datetime import date, datetime, timezone
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0003_partition_ledger_searches"
+down_revision = "0002_glossary_terms"
+branch_labels = None
+depends_on = None
+
+MONTHS_AHEAD = 3
+
+def _add_month(d: date) -> date:
+    return date(d.year + (d.month // 12), d.month % 12 + 1, 1)
+
+def _create_monthly_partitions(table: str):
+    bind = op.get_bind()
+    oldest = bind.execute(sa.text(f"SELECT min(created_at) FROM {table}_legacy")).scalar()
+    now = datetime.now(timezone.utc)
+    start = (oldest or now).astimezone(timezone.utc)
+    month = date(start.year, start.month, 1)
+    last = date(now.year, now.month, 1)
+    for _ in range(MONTHS_AHEAD):
+        last = _add_month(last)
+
+    while month <= last:
+        nxt = _add_month(month)
+        op.execute(
+            f"CREATE TABLE {table}_p{month:%Y_%m} PARTITION OF {table} "
+            f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') TO ('{nxt.isoformat()} 00:00:00+00')"
+        )
+        month = nxt
+    op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+
+def upgrade():
+    op.rename_table("credit_ledger", "credit_ledger_legacy")
+    op.execute("ALTER INDEX ix_credit_ledger_user_id RENAME TO ix_credit_ledger_legacy_user_id")
+    op.execute("ALTER TABLE credit_ledger_legacy RENAME CONSTRAINT credit_ledger_pkey TO credit_ledger_legacy_pkey")
+    op.create_table(
+        "credit_ledger",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("user_id", sa.Uuid(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("type", sa.String(length=50), nullable=False),
+        sa.Column("amount", sa.Integer(), nullable=False),
+        sa.Column("reference_type", sa.String(length=50), nullable=True),
+        sa.Column("reference_id", sa.String(length=64), nullable=True),
+        sa.Column("note", sa.String(length=255), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.PrimaryKeyConstraint("id", "created_at"),
+        postgresql_partition_by="RANGE (created_at)",
+    )
+    op.create_index("ix_credit_ledger_user_id_created_at", "credit_ledger", ["user_id", "created_at"])
+    _create_monthly_partitions("credit_ledger")
+    op.execute(
+        "INSERT INTO credit_ledger (id, user_id, type, amount, reference_type, reference_id, note, created_at) "
+        "SELECT id, user_id, type, amount, reference_type, reference_id, note, COALESCE(created_at, now()) "
+        "FROM credit_ledger_legacy"
+    )
+    op.drop_table("credit_ledger_legacy")
+
+    op.rename_table("discovery_searches", "discovery_searches_legacy")
+    op.execute("ALTER INDEX ix_discovery_searches_user_id RENAME TO ix_discovery_searches_legacy_user_id")
+    op.execute("ALTER TABLE discovery_searches_legacy RENAME CONSTRAINT discovery_searches_pkey TO discovery_searches_legacy_pkey")
+    op.create_table(
+        "discovery_searches",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("user_id", sa.Uuid(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("query", sa.Text(), nullable=False),
+        sa.Column("estimated_tokens", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("debit_ledger_id", sa.String(length=64), nullable=True),
+        sa.Column("result_json", sa.Text(), nullable=True),
+        sa.Column("result_uri", sa.String(length=1024), nullable=True),
+        sa.Column("synthesis_text", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.PrimaryKeyConstraint("id", "created_at"),
+        postgresql_partition_by="RANGE (created_at)",
+    )
+    op.create_index("ix_discovery_searches_user_id_created_at", "discovery_searches", ["user_id", "created_at"])
+    _create_monthly_partitions("discovery_searches")
+    op.execute(
+        "INSERT INTO discovery_searches (id, user_id, query, estimated_tokens, debit_ledger_id, result_json, synthesis_text, created_at) "
+        "SELECT id, user_id, query, estimated_tokens, debit_ledger_id, result_json, synthesis_text, COALESCE(created_at, now()) "
+        "FROM discovery_searches_legacy"
+    )
+    op.drop_table("discovery_searches_legacy")
+
+def downgrade():
+    # Archived result_json payloads stay in storage; only result_uri is lost on downgrade.
+    op.rename_table("discovery_searches", "discovery_searches_partitioned")
+    op.execute("ALTER TABLE discovery_searches_partitioned RENAME CONSTRAINT discovery_searches_pkey TO discovery_searches_partitioned_pkey")
+    op.create_table(
+        "discovery_searches",
+        sa.Column("id", sa.Uuid(), primary_key=True),
+        sa.Column("user_id", sa.Uuid(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("query", sa.Text(), nullable=False),
+        sa.Column("estimated_tokens", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("debit_ledger_id", sa.String(length=64), nullable=True),
+        sa.Column("result_json", sa.Text(), nullable=True),
+        sa.Column("synthesis_text", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.execute(
+        "INSERT INTO discovery_searches (id, user_id, query, estimated_tokens, debit_ledger_id, result_json, synthesis_text, created_at) "
+        "SELECT id, user_id, query, estimated_tokens, debit_ledger_id, result_json, synthesis_text, created_at "
+        "FROM discovery_searches_partitioned"
+    )
+    op.drop_table("discovery_searches_partitioned")
+    op.create_index("ix_discovery_searches_user_id", "discovery_searches", ["user_id"])
+
+    op.rename_table("credit_ledger", "credit_ledger_partitioned")
+    op.execute("ALTER TABLE credit_ledger_partitioned RENAME CONSTRAINT credit_ledger_pkey TO credit_ledger_partitioned_pkey")
+    op.create_table(
+        "credit_ledger",
+        sa.Column("id", sa.Uuid(), primary_key=True),
+        sa.Column("user_id", sa.Uuid(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("type", sa.String(length=50), nullable=False),
+        sa.Column("amount", sa.Integer(), nullable=False),
+        sa.Column("reference_type", sa.String(length=50), nullable=True),
+        sa.Column("reference_id", sa.String(length=64), nullable=True),
+        sa.Column("note", sa.String(length=255), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.execute(
+        "INSERT INTO credit_ledger (id, user_id, type, amount, reference_type, reference_id, note, created_at) "
+        "SELECT id, user_id, type, amount, reference_type, reference_id, note, created_at "
+        "FROM credit_ledger_partitioned"
+    )
+    op.drop_table("credit_ledger_partitioned")
+    op.create_index("ix_credit_ledger_user_id", "credit_ledger", ["user_id"])
@@ -0,0 +1,26 @@
+"""(user_id, created_at) indexes for jobs and library items
+
+Revision ID: 0004_user_created_at_indexes
+Revises: 0003_partition_ledger_searches
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0004_user_created_at_indexes"
+down_revision = "0003_partition_ledger_searches"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # The composite index also serves plain user_id lookups, so it replaces the single-column one
+    op.create_index("ix_translation_jobs_user_id_created_at", "translation_jobs", ["user_id", "created_at"])
+    op.drop_index("ix_translation_jobs_user_id", table_name="translation_jobs")
+    op.create_index("ix_library_items_user_id_created_at", "library_items", ["user_id", "created_at"])
+    op.drop_index("ix_library_items_user_id", table_name="library_items")
+
+def downgrade():
+    op.create_index("ix_library_items_user_id", "library_items", ["user_id"])
+    op.drop_index("ix_library_items_user_id_created_at", table_name="library_items")
+    op.create_index("ix_translation_jobs_user_id", "translation_jobs", ["user_id"])
+    op.drop_index("ix_translation_jobs_user_id_created_at", table_name="translation_jobs")
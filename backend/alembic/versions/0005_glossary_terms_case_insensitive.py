@@ -0,0 +1,32 @@
+"""case-insensitive glossary term uniqueness
+
+Revision ID: 0005_glossary_terms_case_insensitive
+Revises: 0004_user_created_at_indexes
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0005_glossary_terms_case_insensitive"
+down_revision = "0004_user_created_at_indexes"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # Keep the earliest entry of any case-only duplicates; the matcher lowercases patterns anyway
+    op.execute(
+        "DELETE FROM glossary_terms g USING glossary_terms o "
+        "WHERE g.user_id = o.user_id AND lower(g.source_term) = lower(o.source_term) "
+        "AND (g.created_at, g.id) > (o.created_at, o.id)"
+    )
+    op.drop_constraint("uq_glossary_terms_user_source", "glossary_terms", type_="unique")
+    op.create_index(
+        "uq_glossary_terms_user_source_lower",
+        "glossary_terms",
+        ["user_id", sa.text("lower(source_term)")],
+        unique=True,
+    )
+
+def downgrade():
+    op.drop_index("uq_glossary_terms_user_source_lower", table_name="glossary_terms")
+    op.create_unique_constraint("uq_glossary_terms_user_source", "glossary_terms", ["user_id", "source_term"])
@@ -4,6 +4,8 @@ from app.api.v1.endpoints.credits import router as credits_router
 from app.api.v1.endpoints.jobs import router as jobs_router
 from app.api.v1.endpoints.discovery import router as discovery_router
 from app.api.v1.endpoints.library import router as library_router
+from app.api.v1.endpoints.glossary import router as glossary_router
+from app.api.v1.endpoints.exports import router as exports_router
 
 router = APIRouter()
 router.include_router(auth_router, prefix="/auth", tags=["auth"])
@@ -11,3 +13,5 @@ router.include_router(credits_router, prefix="/credits", tags=["credits"])
 router.include_router(jobs_router, prefix="/jobs", tags=["jobs"])
 router.include_router(discovery_router, prefix="/discovery", tags=["discovery"])
 router.include_router(library_router, prefix="/library", tags=["library"])
+router.include_router(glossary_router, prefix="/glossary", tags=["glossary"])
+router.include_router(exports_router, prefix="/exports", tags=["exports"])
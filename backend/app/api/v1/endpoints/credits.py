@@ -1,8 +1,12 @@
-from fastapi import APIRouter, Depends
+from datetime import datetime, timedelta, timezone
+from fastapi import APIRouter, Depends, Header, Query
 from pydantic import BaseModel
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from app.api.deps import get_db, get_current_user
+from app.core.config import settings
 from app.db.models.credit_ledger import CreditLedger
+from app.services.idempotency_service import request_fingerprint, run_idempotent
 
 router = APIRouter()
 
@@ -12,18 +16,36 @@ class TopupIn(BaseModel):
 
 @router.get("/balance")
 def balance(db: Session = Depends(get_db), user=Depends(get_current_user)):
-    total = db.query(CreditLedger).filter(CreditLedger.user_id == user.id).all()
-    balance_val = sum(x.amount for x in total) if total else 0
-    return {"balance": balance_val}
+    total = db.query(func.coalesce(func.sum(CreditLedger.amount), 0)).filter(CreditLedger.user_id == user.id).scalar()
+    return {"balance": int(total or 0)}
 
 @router.get("/ledger")
-def ledger(db: Session = Depends(get_db), user=Depends(get_current_user)):
-    rows = db.query(CreditLedger).filter(CreditLedger.user_id == user.id).order_by(CreditLedger.created_at.desc()).all()
+def ledger(
+    days: int = Query(default=90, ge=1, le=settings.LEDGER_RETENTION_MONTHS * 31),
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user),
+):
+    # Bounded window so Postgres prunes to the recent monthly partitions; full history is in /exports/ledger
+    since = datetime.now(timezone.utc) - timedelta(days=days)
+    rows = (
+        db.query(CreditLedger)
+        .filter(CreditLedger.user_id == user.id, CreditLedger.created_at >= since)
+        .order_by(CreditLedger.created_at.desc())
+        .all()
+    )
     return {"items": [{"id": str(r.id), "type": r.type, "amount": r.amount, "note": r.note, "created_at": r.created_at.isoformat()} for r in rows]}
 
 @router.post("/topup")
-def topup(payload: TopupIn, db: Session = Depends(get_db), user=Depends(get_current_user)):
-    row = CreditLedger(user_id=user.id, type="TOPUP", amount=payload.amount, note=payload.note)
-    db.add(row)
-    db.commit()
-    return {"ok": True}
+def topup(
+    payload: TopupIn,
+    idempotency_key: str | None = Header(default=None, alias="Idempotency-Key"),
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user),
+):
+    def _topup():
+        row = CreditLedger(user_id=user.id, type="TOPUP", amount=payload.amount, note=payload.note)
+        db.add(row)
+        db.commit()
+        return {"ok": True}
+
+    return run_idempotent("credits.topup", user.id, idempotency_key, request_fingerprint(payload.model_dump()), _topup)
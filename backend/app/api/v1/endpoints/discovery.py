@@ -1,8 +1,9 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 from app.api.deps import get_db, get_current_user
 from app.db.models.discovery_search import DiscoverySearch
+from app.services.idempotency_service import request_fingerprint, run_idempotent
 
 router = APIRouter()
 
@@ -13,9 +14,17 @@ class SearchIn(BaseModel):
     include_synthesis: bool = False
 
 @router.post("/search")
-def search(payload: SearchIn, db: Session = Depends(get_db), user=Depends(get_current_user)):
-    row = DiscoverySearch(user_id=user.id, query=payload.query, estimated_tokens=0)
-    db.add(row)
-    db.commit()
-    db.refresh(row)
-    return {"search_id": str(row.id), "query": payload.query, "results": [], "synthesis": None}
+def search(
+    payload: SearchIn,
+    idempotency_key: str | None = Header(default=None, alias="Idempotency-Key"),
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user),
+):
+    def _search():
+        row = DiscoverySearch(user_id=user.id, query=payload.query, estimated_tokens=0)
+        db.add(row)
+        db.commit()
+        db.refresh(row)
+        return {"search_id": str(row.id), "query": payload.query, "results": [], "synthesis": None}
+
+    return run_idempotent("discovery.search", user.id, idempotency_key, request_fingerprint(payload.model_dump()), _search)
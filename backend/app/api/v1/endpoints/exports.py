@@ -0,0 +1,80 @@
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from app.api.deps import get_current_user
+from app.db.models.credit_ledger import CreditLedger
+from app.db.models.library_item import LibraryItem
+from app.db.models.translation_job import TranslationJob
+from app.services.export_service import MEDIA_TYPES, stream_rows
+
+router = APIRouter()
+
+def _export(stmt, fmt: str, name: str) -> StreamingResponse:
+    if fmt not in MEDIA_TYPES:
+        raise HTTPException(status_code=400, detail="Invalid format")
+    return StreamingResponse(
+        stream_rows(stmt, fmt),
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{name}.{fmt}"'},
+    )
+
+@router.get("/ledger")
+def export_ledger(format: str = "ndjson", user=Depends(get_current_user)):
+    stmt = (
+        select(
+            CreditLedger.id,
+            CreditLedger.type,
+            CreditLedger.amount,
+            CreditLedger.reference_type,
+            CreditLedger.reference_id,
+            CreditLedger.note,
+            CreditLedger.created_at,
+        )
+        .where(CreditLedger.user_id == user.id)
+        .order_by(CreditLedger.created_at)
+    )
+    return _export(stmt, format, "ledger")
+
+@router.get("/jobs")
+def export_jobs(format: str = "ndjson", user=Depends(get_current_user)):
+    stmt = (
+        select(
+            TranslationJob.id,
+            TranslationJob.source_lang,
+            TranslationJob.target_lang,
+            TranslationJob.status,
+            TranslationJob.input_uri,
+            TranslationJob.output_docx_uri,
+            TranslationJob.output_pdf_uri,
+            TranslationJob.total_chunks,
+            TranslationJob.processed_chunks,
+            TranslationJob.token_est_in,
+            TranslationJob.token_est_out,
+            TranslationJob.token_act_in,
+            TranslationJob.token_act_out,
+            TranslationJob.debit_ledger_id,
+            TranslationJob.error_message,
+            TranslationJob.created_at,
+            TranslationJob.completed_at,
+        )
+        .where(TranslationJob.user_id == user.id)
+        .order_by(TranslationJob.created_at)
+    )
+    return _export(stmt, format, "jobs")
+
+@router.get("/library")
+def export_library(format: str = "ndjson", user=Depends(get_current_user)):
+    stmt = (
+        select(
+            LibraryItem.id,
+            LibraryItem.type,
+            LibraryItem.title,
+            LibraryItem.metadata_json,
+            LibraryItem.file_docx_uri,
+            LibraryItem.file_pdf_uri,
+            LibraryItem.created_at,
+        )
+        .where(LibraryItem.user_id == user.id)
+        .order_by(LibraryItem.created_at)
+    )
+    return _export(stmt, format, "library")
@@ -0,0 +1,64 @@
+import uuid
+from fastapi import APIRouter, Depends, HTTPException
+from pydantic import BaseModel, Field
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from app.api.deps import get_db, get_current_user
+from app.db.models.glossary_term import GlossaryTerm
+from app.services.glossary_service import get_compiled_glossary
+
+router = APIRouter()
+
+class TermIn(BaseModel):
+    source_term: str = Field(min_length=1, max_length=255)
+    target_term: str = Field(min_length=1, max_length=255)
+    note: str | None = Field(default=None, max_length=255)
+
+class MatchIn(BaseModel):
+    text: str
+
+@router.get("/terms")
+def list_terms(db: Session = Depends(get_db), user=Depends(get_current_user)):
+    rows = db.query(GlossaryTerm).filter(GlossaryTerm.user_id == user.id).order_by(GlossaryTerm.created_at).all()
+    return {"items": [{"id": str(r.id), "source_term": r.source_term, "target_term": r.target_term, "note": r.note} for r in rows]}
+
+@router.post("/terms")
+def create_term(payload: TermIn, db: Session = Depends(get_db), user=Depends(get_current_user)):
+    source_term = payload.source_term.strip()
+    target_term = payload.target_term.strip()
+    if not source_term or not target_term:
+        raise HTTPException(status_code=400, detail="Empty term")
+
+    existing = (
+        db.query(GlossaryTerm)
+        .filter(GlossaryTerm.user_id == user.id, func.lower(GlossaryTerm.source_term) == source_term.lower())
+        .first()
+    )
+    if existing:
+        raise HTTPException(status_code=409, detail="Term already exists")
+
+    row = GlossaryTerm(user_id=user.id, source_term=source_term, target_term=target_term, note=payload.note)
+    db.add(row)
+    try:
+        db.commit()
+    except IntegrityError:
+        # Lost a race with a concurrent insert of the same term
+        db.rollback()
+        raise HTTPException(status_code=409, detail="Term already exists")
+    db.refresh(row)
+    return {"id": str(row.id)}
+
+@router.delete("/terms/{term_id}")
+def delete_term(term_id: uuid.UUID, db: Session = Depends(get_db), user=Depends(get_current_user)):
+    row = db.query(GlossaryTerm).filter(GlossaryTerm.id == term_id, GlossaryTerm.user_id == user.id).first()
+    if not row:
+        raise HTTPException(status_code=404, detail="Not found")
+    db.delete(row)
+    db.commit()
+    return {"ok": True}
+
+@router.post("/match")
+def match(payload: MatchIn, db: Session = Depends(get_db), user=Depends(get_current_user)):
+    glossary = get_compiled_glossary(db, user.id)
+    return {"items": [{"source_term": s, "target_term": t} for s, t in glossary.terms_in(payload.text)]}
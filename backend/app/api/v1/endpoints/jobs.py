@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Depends, UploadFile, File, HTTPException
+from fastapi import APIRouter, Depends, UploadFile, File, Header, HTTPException
 from sqlalchemy.orm import Session
 from app.api.deps import get_db, get_current_user
 from app.db.models.translation_job import TranslationJob
+from app.services.idempotency_service import file_digest, request_fingerprint, run_idempotent
 
 router = APIRouter()
 
@@ -11,24 +12,31 @@ def create_job(
     target_lang: str,
     output_format: str = "docx",
     upload: UploadFile = File(...),
+    idempotency_key: str | None = Header(default=None, alias="Idempotency-Key"),
     db: Session = Depends(get_db),
     user=Depends(get_current_user),
 ):
     if output_format not in ("docx", "pdf", "both"):
         raise HTTPException(status_code=400, detail="Invalid output_format")
 
-    # For test-stage boot: just create job row (worker tasks later)
-    job = TranslationJob(
-        user_id=user.id,
-        source_lang=source_lang,
-        target_lang=target_lang,
-        input_uri=f"local://uploads/{upload.filename}",
-        status="PENDING",
-    )
-    db.add(job)
-    db.commit()
-    db.refresh(job)
-    return {"job_id": str(job.id), "status": job.status}
+    def _create():
+        # For test-stage boot: just create job row (worker tasks later)
+        job = TranslationJob(
+            user_id=user.id,
+            source_lang=source_lang,
+            target_lang=target_lang,
+            input_uri=f"local://uploads/{upload.filename}",
+            status="PENDING",
+        )
+        db.add(job)
+        db.commit()
+        db.refresh(job)
+        return {"job_id": str(job.id), "status": job.status}
+
+    def _fingerprint():
+        return request_fingerprint(source_lang, target_lang, output_format, upload.filename, file_digest(upload.file))
+
+    return run_idempotent("jobs.create", user.id, idempotency_key, _fingerprint, _create)
 
 @router.get("/{job_id}")
 def get_job(job_id: str, db: Session = Depends(get_db), user=Depends(get_current_user)):
@@ -1,16 +0,0 @@
-from celery import Celery
-from app.core.config import settings
-
-celery_app = Celery(
-    "jurnallingua",
-    broker=settings.CELERY_BROKER_URL,
-    backend=settings.CELERY_BROKER_URL,
-)
-
-celery_app.conf.update(
-    task_serializer="json",
-    accept_content=["json"],
-    result_serializer="json",
-    timezone="UTC",
-    enable_utc=True,
-)
\ No newline at end of file
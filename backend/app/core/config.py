@@ -30,6 +30,25 @@ class Settings(BaseSettings):
     MAX_CHUNKS_PER_JOB: int = 200
     CREDIT_COST_PER_1K_TOKENS: int = 10
 
+    GLOSSARY_CACHE_SIZE: int = 256
+
+    IDEMPOTENCY_TTL_SECONDS: int = 86400
+    IDEMPOTENCY_LOCK_TTL_SECONDS: int = 120
+    IDEMPOTENCY_WAIT_SECONDS: float = 30.0
+    IDEMPOTENCY_POLL_INTERVAL_SECONDS: float = 0.05
+
+    PARTITION_MONTHS_AHEAD: int = 3
+    LEDGER_RETENTION_MONTHS: int = 12
+    DISCOVERY_RESULT_HOT_DAYS: int = 90
+    ARCHIVE_BATCH_SIZE: int = 500
+
+    EXPORT_BATCH_SIZE: int = 1000
+
+    CELERY_VISIBILITY_TIMEOUT: int = 7200
+    AUTOSCALE_TARGET_DRAIN_SECONDS: float = 60.0
+    AUTOSCALE_SAMPLE_INTERVAL_SECONDS: float = 1.0
+    AUTOSCALE_LATENCY_SAMPLES: int = 50
+
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
     @property
@@ -43,4 +62,8 @@ class Settings(BaseSettings):
     def CELERY_BROKER_URL(self) -> str:
         return f"redis://{self.REDIS_HOST}:{self.REDIS_PORT}/0"
 
+    @property
+    def REDIS_CACHE_URL(self) -> str:
+        return f"redis://{self.REDIS_HOST}:{self.REDIS_PORT}/1"
+
 settings = Settings()
@@ -3,5 +3,6 @@ from app.db.models.credit_ledger import CreditLedger
 from app.db.models.translation_job import TranslationJob
 from app.db.models.discovery_search import DiscoverySearch
 from app.db.models.library_item import LibraryItem
+from app.db.models.glossary_term import GlossaryTerm
 
-__all__ = ["User", "CreditLedger", "TranslationJob", "DiscoverySearch", "LibraryItem"]
+__all__ = ["User", "CreditLedger", "TranslationJob", "DiscoverySearch", "LibraryItem", "GlossaryTerm"]
@@ -1,20 +1,26 @@
 import uuid
 from datetime import datetime, timezone
-from sqlalchemy import String, DateTime, Integer, ForeignKey
+from sqlalchemy import String, DateTime, Integer, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column
 from app.db.base import Base
 
 class CreditLedger(Base):
     __tablename__ = "credit_ledger"
+    __table_args__ = (
+        Index("ix_credit_ledger_user_id_created_at", "user_id", "created_at"),
+        {"postgresql_partition_by": "RANGE (created_at)"},  # monthly partitions, see retention_service
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
-    user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id"), index=True, nullable=False)
+    user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id"), nullable=False)
 
-    type: Mapped[str] = mapped_column(String(50), nullable=False)  # TOPUP / DEBIT_TRANSLATION / DEBIT_DISCOVERY
+    type: Mapped[str] = mapped_column(String(50), nullable=False)  # TOPUP / DEBIT_TRANSLATION / DEBIT_DISCOVERY / OPENING_BALANCE
     amount: Mapped[int] = mapped_column(Integer, nullable=False)   # + topup, - debit
 
     reference_type: Mapped[str] = mapped_column(String(50), nullable=True)
     reference_id: Mapped[str] = mapped_column(String(64), nullable=True)
 
     note: Mapped[str] = mapped_column(String(255), nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), primary_key=True, default=lambda: datetime.now(timezone.utc)
+    )
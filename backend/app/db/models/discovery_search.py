@@ -1,20 +1,27 @@
 import uuid
 from datetime import datetime, timezone
-from sqlalchemy import String, DateTime, Integer, ForeignKey, Text
+from sqlalchemy import String, DateTime, Integer, ForeignKey, Index, Text
 from sqlalchemy.orm import Mapped, mapped_column
 from app.db.base import Base
 
 class DiscoverySearch(Base):
     __tablename__ = "discovery_searches"
+    __table_args__ = (
+        Index("ix_discovery_searches_user_id_created_at", "user_id", "created_at"),
+        {"postgresql_partition_by": "RANGE (created_at)"},  # monthly partitions, see retention_service
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
-    user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id"), index=True, nullable=False)
+    user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id"), nullable=False)
 
     query: Mapped[str] = mapped_column(Text, nullable=False)
     estimated_tokens: Mapped[int] = mapped_column(Integer, default=0)
     debit_ledger_id: Mapped[str] = mapped_column(String(64), nullable=True)
 
     result_json: Mapped[str] = mapped_column(Text, nullable=True)
+    result_uri: Mapped[str] = mapped_column(String(1024), nullable=True)  # gzip archive once result_json is moved out
     synthesis_text: Mapped[str] = mapped_column(Text, nullable=True)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), primary_key=True, default=lambda: datetime.now(timezone.utc)
+    )
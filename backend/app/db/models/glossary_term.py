@@ -0,0 +1,19 @@
+import uuid
+from datetime import datetime, timezone
+from sqlalchemy import String, DateTime, ForeignKey, Index, text
+from sqlalchemy.orm import Mapped, mapped_column
+from app.db.base import Base
+
+class GlossaryTerm(Base):
+    __tablename__ = "glossary_terms"
+    # Matching is case-insensitive, so uniqueness is too
+    __table_args__ = (Index("uq_glossary_terms_user_source_lower", "user_id", text("lower(source_term)"), unique=True),)
+
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id"), index=True, nullable=False)
+
+    source_term: Mapped[str] = mapped_column(String(255), nullable=False)
+    target_term: Mapped[str] = mapped_column(String(255), nullable=False)
+    note: Mapped[str] = mapped_column(String(255), nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
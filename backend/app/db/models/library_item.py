@@ -1,14 +1,15 @@
 import uuid
 from datetime import datetime, timezone
-from sqlalchemy import String, DateTime, ForeignKey, Text
+from sqlalchemy import String, DateTime, Index, ForeignKey, Text
 from sqlalchemy.orm import Mapped, mapped_column
 from app.db.base import Base
 
 class LibraryItem(Base):
     __tablename__ = "library_items"
+    __table_args__ = (Index("ix_library_items_user_id_created_at", "user_id", "created_at"),)
 
     id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
-    user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id"), index=True, nullable=False)
+    user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id"), nullable=False)
 
     type: Mapped[str] = mapped_column(String(50), nullable=False)  # TRANSLATION_OUTPUT / DISCOVERY_ITEM
     title: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -1,14 +1,15 @@
 import uuid
 from datetime import datetime, timezone
-from sqlalchemy import String, DateTime, Integer, ForeignKey
+from sqlalchemy import String, DateTime, Index, Integer, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column
 from app.db.base import Base
 
 class TranslationJob(Base):
     __tablename__ = "translation_jobs"
+    __table_args__ = (Index("ix_translation_jobs_user_id_created_at", "user_id", "created_at"),)
 
     id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
-    user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id"), index=True, nullable=False)
+    user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id"), nullable=False)
 
     source_lang: Mapped[str] = mapped_column(String(16), nullable=False)
     target_lang: Mapped[str] = mapped_column(String(16), nullable=False)
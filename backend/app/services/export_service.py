@@ -0,0 +1,57 @@
+import csv
+import io
+import json
+import uuid
+from datetime import datetime
+from typing import Iterator
+from sqlalchemy import Select
+from app.core.config import settings
+from app.db.session import SessionLocal
+
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+def _json_default(v):
+    if isinstance(v, datetime):
+        return v.isoformat()
+    if isinstance(v, uuid.UUID):
+        return str(v)
+    raise TypeError(f"Unserializable {type(v).__name__}")
+
+# Spreadsheet apps evaluate cells starting with these as formulas (CSV injection)
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+def _csv_cell(v):
+    if v is None:
+        return ""
+    if isinstance(v, datetime):
+        return v.isoformat()
+    if isinstance(v, str) and v.startswith(_FORMULA_PREFIXES):
+        return "'" + v
+    return v
+
+def stream_rows(stmt: Select, fmt: str) -> Iterator[str]:
+    """
+    Stream stmt as NDJSON or CSV from a server-side cursor, one chunk per fetched batch.
+    Owns its session: request-scoped sessions are closed before a StreamingResponse body runs.
+    """
+    encode = json.JSONEncoder(default=_json_default, ensure_ascii=False, separators=(",", ":")).encode
+    db = SessionLocal()
+    try:
+        result = db.execute(stmt.execution_options(yield_per=settings.EXPORT_BATCH_SIZE))
+        columns = list(result.keys())
+
+        if fmt == "csv":
+            buf = io.StringIO()
+            writer = csv.writer(buf)
+            writer.writerow(columns)
+            yield buf.getvalue()
+            for batch in result.partitions():
+                buf.seek(0)
+                buf.truncate()
+                writer.writerows([_csv_cell(v) for v in row] for row in batch)
+                yield buf.getvalue()
+        else:
+            for batch in result.partitions():
+                yield "".join(encode(dict(zip(columns, row))) + "\n" for row in batch)
+    finally:
+        db.close()
@@ -1,9 +1,65 @@
+import logging
 from app.core.config import settings
+from app.services.glossary_service import glossary_instruction
+from app.services.term_matcher import CompiledGlossary
 
-def gemini_translate_text(text: str, source_lang: str, target_lang: str) -> str:
+logger = logging.getLogger(__name__)
+
+def build_system_instruction(
+    source_lang: str,
+    target_lang: str,
+    glossary_terms: list[tuple[str, str]] | None = None,
+) -> str:
+    parts = [
+        "You are an elite academic translator specializing in scholarly journals.",
+        f"Source Language: {source_lang}",
+        f"Target Language: {target_lang}",
+        "Preserve all mathematical formulas and citations.",
+    ]
+    glossary = glossary_instruction(glossary_terms or [])
+    if glossary:
+        parts.append(glossary)
+    return "\n".join(parts)
+
+def _generate(system_instruction: str, text: str, source_lang: str, target_lang: str) -> str:
     """
     MVP stub (so system runs without blowing up).
-    Next step: implement real Gemini call.
+    Next step: send system_instruction + text via google-generativeai.
     """
     # TODO: implement Gemini API call via google-generativeai
-    return f"[STUB {source_lang}->{target_lang}] {text}"
\ No newline at end of file
+    return f"[STUB {source_lang}->{target_lang}] {text}"
+
+def gemini_translate_text(
+    text: str,
+    source_lang: str,
+    target_lang: str,
+    glossary_terms: list[tuple[str, str]] | None = None,
+) -> str:
+    system_instruction = build_system_instruction(source_lang, target_lang, glossary_terms)
+    return _generate(system_instruction, text, source_lang, target_lang)
+
+def translate_chunk(
+    text: str,
+    source_lang: str,
+    target_lang: str,
+    glossary: CompiledGlossary | None = None,
+    job_id: str | None = None,
+) -> tuple[str, list[tuple[str, str]]]:
+    """
+    Translate one chunk, injecting only the glossary entries it actually contains.
+    Returns the translation and the entries whose target term is missing from it (also logged).
+    """
+    if glossary is None:
+        return gemini_translate_text(text, source_lang, target_lang), []
+
+    # Scan the source once and reuse the hits for both prompt injection and the post-check
+    required = glossary.match(text)
+    translated = gemini_translate_text(text, source_lang, target_lang, glossary_terms=glossary.terms_for(required))
+    missing = glossary.missing_for(required, translated)
+    if missing:
+        logger.warning(
+            "Glossary terms missing from translation (job=%s): %s",
+            job_id,
+            ", ".join(f"{s} => {t}" for s, t in missing),
+        )
+    return translated, missing
@@ -0,0 +1,51 @@
+import threading
+from collections import OrderedDict
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.db.models.glossary_term import GlossaryTerm
+from app.services.term_matcher import CompiledGlossary
+
+_cache: "OrderedDict[str, tuple[tuple, CompiledGlossary]]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+def get_compiled_glossary(db: Session, user_id) -> CompiledGlossary:
+    """
+    Compiled glossary for a user, rebuilt only when their terms change.
+    The fingerprint query is a single indexed aggregate, so API and worker processes
+    each keep their own cache without needing explicit invalidation.
+    """
+    count, last = (
+        db.query(func.count(GlossaryTerm.id), func.max(GlossaryTerm.created_at))
+        .filter(GlossaryTerm.user_id == user_id)
+        .one()
+    )
+    fingerprint = (count, last)
+    key = str(user_id)
+
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached and cached[0] == fingerprint:
+            _cache.move_to_end(key)
+            return cached[1]
+
+    rows = (
+        db.query(GlossaryTerm.source_term, GlossaryTerm.target_term)
+        .filter(GlossaryTerm.user_id == user_id)
+        .order_by(GlossaryTerm.created_at, GlossaryTerm.id)
+        .all()
+    )
+    compiled = CompiledGlossary([(r.source_term, r.target_term) for r in rows])
+
+    with _cache_lock:
+        _cache[key] = (fingerprint, compiled)
+        _cache.move_to_end(key)
+        while len(_cache) > settings.GLOSSARY_CACHE_SIZE:
+            _cache.popitem(last=False)
+    return compiled
+
+def glossary_instruction(terms: list[tuple[str, str]]) -> str:
+    if not terms:
+        return ""
+    lines = "\n".join(f"- {s} => {t}" for s, t in terms)
+    return f"Use exactly these terminology translations:\n{lines}"
@@ -0,0 +1,101 @@
+import hashlib
+import json
+import logging
+import time
+import uuid
+from typing import BinaryIO, Callable
+import redis
+from fastapi import HTTPException
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_client: redis.Redis | None = None
+
+# Only the request holding the claim token may release or complete a key; a claim that expired
+# mid-request and was taken over by a duplicate must not be deleted or overwritten by the original.
+_RELEASE_SCRIPT = """
+local cur = redis.call('GET', KEYS[1])
+if cur and cjson.decode(cur)['token'] == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+_COMPLETE_SCRIPT = """
+local cur = redis.call('GET', KEYS[1])
+if cur and cjson.decode(cur)['token'] == ARGV[1] then
+    redis.call('SET', KEYS[1], ARGV[2], 'EX', tonumber(ARGV[3]))
+    return 1
+end
+return 0
+"""
+
+def get_redis() -> redis.Redis:
+    global _client
+    if _client is None:
+        _client = redis.Redis.from_url(settings.REDIS_CACHE_URL, decode_responses=True)
+    return _client
+
+def request_fingerprint(*parts) -> str:
+    raw = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+def file_digest(f: BinaryIO, chunk_size: int = 1 << 20) -> str:
+    """sha256 of a file object's content; leaves the stream rewound for the caller."""
+    h = hashlib.sha256()
+    f.seek(0)
+    for chunk in iter(lambda: f.read(chunk_size), b""):
+        h.update(chunk)
+    f.seek(0)
+    return h.hexdigest()
+
+def run_idempotent(
+    scope: str,
+    user_id,
+    key: str | None,
+    fingerprint: str | Callable[[], str],
+    fn: Callable[[], dict],
+) -> dict:
+    """
+    Execute fn at most once per (user, scope, Idempotency-Key).
+    The first caller claims the key with SET NX and runs fn; concurrent duplicates poll until the
+    result is stored and get it replayed. Failed calls release the key so the client can retry.
+    fingerprint may be a callable so expensive ones (upload hashing) only run when a key is sent.
+    """
+    if not key:
+        return fn()
+    if len(key) > 255:
+        raise HTTPException(status_code=400, detail="Idempotency-Key too long")
+    if callable(fingerprint):
+        fingerprint = fingerprint()
+
+    r = get_redis()
+    redis_key = f"idem:{scope}:{user_id}:{key}"
+    token = uuid.uuid4().hex
+    pending = json.dumps({"state": "pending", "fingerprint": fingerprint, "token": token})
+
+    deadline = time.monotonic() + settings.IDEMPOTENCY_WAIT_SECONDS
+    while not r.set(redis_key, pending, nx=True, ex=settings.IDEMPOTENCY_LOCK_TTL_SECONDS):
+        raw = r.get(redis_key)
+        if raw is None:
+            continue  # released by a failed first attempt; try to claim it ourselves
+        record = json.loads(raw)
+        if record["fingerprint"] != fingerprint:
+            raise HTTPException(status_code=422, detail="Idempotency-Key reused with a different request")
+        if record["state"] == "done":
+            return record["response"]
+        if time.monotonic() > deadline:
+            raise HTTPException(status_code=409, detail="Request with this Idempotency-Key is still in progress")
+        time.sleep(settings.IDEMPOTENCY_POLL_INTERVAL_SECONDS)
+
+    try:
+        response = fn()
+    except BaseException:
+        r.eval(_RELEASE_SCRIPT, 1, redis_key, token)
+        raise
+
+    done = json.dumps({"state": "done", "fingerprint": fingerprint, "token": token, "response": response})
+    if not r.eval(_COMPLETE_SCRIPT, 1, redis_key, token, done, settings.IDEMPOTENCY_TTL_SECONDS):
+        logger.warning("Idempotency claim on %s expired before completion; result not cached", redis_key)
+    return response
@@ -0,0 +1,135 @@
+import gzip
+import re
+from datetime import date, datetime, timezone
+from sqlalchemy import func, text
+from sqlalchemy.orm import Session
+from app.db.models.credit_ledger import CreditLedger
+from app.db.models.discovery_search import DiscoverySearch
+from app.services.storage_service import LocalStorageProvider
+
+PARTITIONED_TABLES = ("credit_ledger", "discovery_searches")
+
+def add_months(d: date, n: int) -> date:
+    idx = d.year * 12 + d.month - 1 + n
+    return date(idx // 12, idx % 12 + 1, 1)
+
+def month_start(d: date) -> datetime:
+    return datetime(d.year, d.month, 1, tzinfo=timezone.utc)
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_p{month:%Y_%m}"
+
+def list_partitions(db: Session, table: str) -> dict[str, date]:
+    """Monthly partitions of table keyed by name (the DEFAULT partition is not included)."""
+    rows = db.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "JOIN pg_class p ON p.oid = i.inhparent "
+            "WHERE p.relname = :table"
+        ),
+        {"table": table},
+    ).scalars()
+    pattern = re.compile(rf"^{table}_p(\d{{4}})_(\d{{2}})$")
+    out = {}
+    for name in rows:
+        m = pattern.match(name)
+        if m:
+            out[name] = date(int(m.group(1)), int(m.group(2)), 1)
+    return out
+
+def ensure_partitions(db: Session, table: str, months_ahead: int) -> list[str]:
+    """
+    Create the current and next months_ahead monthly partitions if missing.
+    Rows that already landed in the DEFAULT partition for a new month (e.g. beat was down) would make
+    CREATE ... PARTITION OF fail, so the default is detached, its rows moved over and reattached,
+    all in the same transaction.
+    """
+    existing = list_partitions(db, table)
+    today = datetime.now(timezone.utc).date()
+    default = f"{table}_default"
+    created = []
+    for i in range(months_ahead + 1):
+        month = add_months(today, i)
+        name = partition_name(table, month)
+        if name in existing:
+            continue
+        bounds = {"lo": month_start(month), "hi": month_start(add_months(month, 1))}
+        stray = db.execute(
+            text(f"SELECT 1 FROM {default} WHERE created_at >= :lo AND created_at < :hi LIMIT 1"), bounds
+        ).first()
+
+        if stray:
+            db.execute(text(f"ALTER TABLE {table} DETACH PARTITION {default}"))
+        db.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table} "
+                f"FOR VALUES FROM ('{bounds['lo'].isoformat()}') TO ('{bounds['hi'].isoformat()}')"
+            )
+        )
+        if stray:
+            db.execute(
+                text(f"INSERT INTO {name} SELECT * FROM {default} WHERE created_at >= :lo AND created_at < :hi"), bounds
+            )
+            db.execute(text(f"DELETE FROM {default} WHERE created_at >= :lo AND created_at < :hi"), bounds)
+            db.execute(text(f"ALTER TABLE {table} ATTACH PARTITION {default} DEFAULT"))
+        created.append(name)
+    db.commit()
+    return created
+
+def rollup_credit_ledger(db: Session, cutoff: date) -> int:
+    """
+    Fold all ledger entries before cutoff into one OPENING_BALANCE row per user dated at cutoff,
+    then drop the emptied monthly partitions. Balances are unchanged; runs in one transaction.
+    Returns the number of OPENING_BALANCE rows written (users whose old entries net to zero get none).
+    """
+    cutoff_at = month_start(cutoff)
+    sums = (
+        db.query(CreditLedger.user_id, func.sum(CreditLedger.amount))
+        .filter(CreditLedger.created_at < cutoff_at)
+        .group_by(CreditLedger.user_id)
+        .all()
+    )
+    written = 0
+    for user_id, total in sums:
+        if total:
+            written += 1
+            db.add(
+                CreditLedger(
+                    user_id=user_id,
+                    type="OPENING_BALANCE",
+                    amount=int(total),
+                    reference_type="ROLLUP",
+                    note=f"Balance carried forward before {cutoff:%Y-%m}",
+                    created_at=cutoff_at,
+                )
+            )
+    db.flush()
+
+    for name, month in list_partitions(db, "credit_ledger").items():
+        if month < cutoff:
+            db.execute(text(f"DROP TABLE {name}"))
+    # Anything left before the cutoff sits in the DEFAULT partition
+    db.query(CreditLedger).filter(CreditLedger.created_at < cutoff_at).delete(synchronize_session=False)
+    db.commit()
+    return written
+
+def archive_discovery_results(db: Session, before: datetime, batch_size: int) -> int:
+    """Move result_json of searches older than before into gzip objects in storage."""
+    storage = LocalStorageProvider()
+    archived = 0
+    while True:
+        rows = (
+            db.query(DiscoverySearch)
+            .filter(DiscoverySearch.created_at < before, DiscoverySearch.result_json.isnot(None))
+            .limit(batch_size)
+            .all()
+        )
+        if not rows:
+            return archived
+        for row in rows:
+            key = f"discovery/{row.user_id}/{row.id}.json.gz"
+            row.result_uri = storage.put_bytes(key, gzip.compress(row.result_json.encode("utf-8")), "application/gzip")
+            row.result_json = None
+        db.commit()
+        archived += len(rows)
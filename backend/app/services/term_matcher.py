@@ -0,0 +1,101 @@
+from collections import deque
+
+def _is_word_char(c: str) -> bool:
+    # CJK scripts have no word separators, so only enforce boundaries for alphabetic scripts
+    return c.isalnum() and c < "\u2e80"
+
+class TermMatcher:
+    """
+    Aho-Corasick automaton over case-folded patterns.
+    Scanning a text is O(len(text) + matches) regardless of how many patterns are loaded.
+    """
+
+    def __init__(self, patterns: list[str]):
+        self.patterns = [p.lower() for p in patterns]
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[list[int]] = [[]]
+        self._out_link: list[int] = [0]  # nearest suffix node that has its own outputs
+
+        for idx, pattern in enumerate(self.patterns):
+            if not pattern:
+                continue
+            node = 0
+            for ch in pattern:
+                nxt = self._goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                    self._out_link.append(0)
+                node = nxt
+            self._out[node].append(idx)
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                f = self._fail[node]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                fail = self._goto[f].get(ch, 0)
+                self._fail[child] = fail
+                self._out_link[child] = fail if self._out[fail] else self._out_link[fail]
+
+    def find(self, text: str) -> set[int]:
+        """Return the indices of patterns that occur in text as whole words."""
+        text = text.lower()
+        found: set[int] = set()
+        goto, fail, out, out_link = self._goto, self._fail, self._out, self._out_link
+        node = 0
+        for pos, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+
+            hit = node if out[node] else out_link[node]
+            while hit:
+                for idx in out[hit]:
+                    if idx not in found and self._is_whole_word(text, pos, self.patterns[idx]):
+                        found.add(idx)
+                hit = out_link[hit]
+        return found
+
+    @staticmethod
+    def _is_whole_word(text: str, end: int, pattern: str) -> bool:
+        start = end - len(pattern) + 1
+        if start > 0 and _is_word_char(pattern[0]) and _is_word_char(text[start - 1]):
+            return False
+        if end + 1 < len(text) and _is_word_char(pattern[-1]) and _is_word_char(text[end + 1]):
+            return False
+        return True
+
+class CompiledGlossary:
+    def __init__(self, terms: list[tuple[str, str]]):
+        self.terms = terms
+        self._source = TermMatcher([s for s, _ in terms])
+        self._target = TermMatcher([t for _, t in terms])
+
+    def match(self, text: str) -> set[int]:
+        """Indices of entries whose source term appears in text; feed to terms_for / missing_for."""
+        return self._source.find(text)
+
+    def terms_for(self, indices: set[int]) -> list[tuple[str, str]]:
+        return [self.terms[i] for i in sorted(indices)]
+
+    def missing_for(self, required: set[int], translated_text: str) -> list[tuple[str, str]]:
+        """Entries in required whose target term is absent from translated_text."""
+        if not required:
+            return []
+        return self.terms_for(required - self._target.find(translated_text))
+
+    def terms_in(self, text: str) -> list[tuple[str, str]]:
+        """Glossary entries whose source term appears in text, in glossary order."""
+        return self.terms_for(self.match(text))
+
+    def missing_in(self, source_text: str, translated_text: str) -> list[tuple[str, str]]:
+        """Entries required by source_text whose target term is absent from translated_text."""
+        return self.missing_for(self.match(source_text), translated_text)
@@ -0,0 +1,117 @@
+import math
+from time import monotonic
+import redis
+from celery.signals import task_postrun, task_prerun
+from celery.worker.autoscale import Autoscaler
+from app.core.config import settings
+
+_redis: redis.Redis | None = None
+_started: dict[str, float] = {}
+
+def get_broker_redis() -> redis.Redis:
+    global _redis
+    if _redis is None:
+        _redis = redis.Redis.from_url(settings.CELERY_BROKER_URL)
+    return _redis
+
+def _latency_key(queue: str) -> str:
+    return f"jurnallingua:latency:{queue}"
+
+@task_prerun.connect
+def _record_start(task_id=None, **kwargs):
+    _started[task_id] = monotonic()
+
+@task_postrun.connect
+def _record_latency(task_id=None, task=None, **kwargs):
+    started = _started.pop(task_id, None)
+    queue = ((task.request.delivery_info or {}).get("routing_key") if task else None)
+    if started is None or not queue:
+        return
+    try:
+        pipe = get_broker_redis().pipeline()
+        pipe.lpush(_latency_key(queue), round(monotonic() - started, 3))
+        pipe.ltrim(_latency_key(queue), 0, settings.AUTOSCALE_LATENCY_SAMPLES - 1)
+        pipe.execute()
+    except redis.RedisError:
+        pass  # latency samples are advisory; never fail a task over them
+
+class QueueDepthAutoscaler(Autoscaler):
+    """
+    Size the pool from the backlog of the queues this worker consumes.
+    Stock Celery sets the prefetch count to max_concurrency * prefetch_multiplier when --autoscale is
+    used, so a small pool still reserves up to max messages and grows off that reserved count; with
+    acks_late those reserved messages are held by this worker and can't run anywhere else. Instead the
+    prefetch is kept at current pool size * multiplier, and growth is driven by queue depth: the target
+    is the tasks already reserved plus enough slots to drain depth * mean task latency within
+    AUTOSCALE_TARGET_DRAIN_SECONDS, never more than one slot per queued message.
+    Scale-down still waits out the stock keepalive.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._sampled_at = 0.0
+        self._backlog_target = 0
+
+    @property
+    def processes(self):
+        # gevent reports running greenlets as num_processes; its capacity is the pool size
+        size = getattr(getattr(self.pool, "_pool", None), "size", None)
+        return size if isinstance(size, int) else self.pool.num_processes
+
+    def _queues(self) -> list[str]:
+        return list(self.worker.app.amqp.queues.consume_from) if self.worker else []
+
+    def _sample_backlog_target(self) -> int:
+        now = monotonic()
+        if now - self._sampled_at < settings.AUTOSCALE_SAMPLE_INTERVAL_SECONDS:
+            return self._backlog_target
+        self._sampled_at = now
+
+        try:
+            r = get_broker_redis()
+            pipe = r.pipeline()
+            queues = self._queues()
+            for q in queues:
+                pipe.llen(q)
+                pipe.lrange(_latency_key(q), 0, -1)
+            replies = pipe.execute()
+        except redis.RedisError:
+            return self._backlog_target
+
+        depth = sum(replies[0::2])
+        samples = [float(x) for lat in replies[1::2] for x in lat]
+        if not depth:
+            self._backlog_target = 0
+        elif not samples:
+            self._backlog_target = depth  # no latency seen yet: one slot per waiting task
+        else:
+            mean = sum(samples) / len(samples)
+            # Slow tasks need more slots to drain in time, but a slot without a message can't help
+            self._backlog_target = min(depth, math.ceil(depth * mean / settings.AUTOSCALE_TARGET_DRAIN_SECONDS))
+        return self._backlog_target
+
+    def _maybe_scale(self, req=None):
+        procs = self.processes
+        target = self.qty + self._sample_backlog_target()
+        target = min(max(target, self.min_concurrency), self.max_concurrency)
+        scaled = None
+        if target > procs:
+            self.scale_up(target - procs)
+            scaled = True
+        elif target < procs:
+            self.scale_down(procs - target)
+            scaled = True
+        self._sync_prefetch()
+        return scaled
+
+    def _sync_prefetch(self):
+        """Cap the consumer's prefetch at the current pool size (applied by the consumer loop)."""
+        consumer = getattr(self.worker, "consumer", None)
+        qos = getattr(consumer, "qos", None)
+        if qos is None:
+            return  # consumer not started yet
+        want = max(self.processes, 1) * max(consumer.prefetch_multiplier, 1)
+        if qos.value > want:
+            qos.decrement_eventually(qos.value - want)
+        elif qos.value < want:
+            qos.increment_eventually(want - qos.value)
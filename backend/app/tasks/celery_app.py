@@ -1,13 +1,57 @@
 from celery import Celery
+from celery.schedules import crontab
+from kombu import Queue
 from app.core.config import settings
 
 celery_app = Celery(
     "jurnallingua",
     broker=settings.CELERY_BROKER_URL,
     backend=settings.CELERY_BROKER_URL,
+    include=[
+        "app.tasks.translation_tasks",
+        "app.tasks.discovery_tasks",
+        "app.tasks.rendering_tasks",
+        "app.tasks.maintenance_tasks",
+    ],
 )
 
+celery_app.conf.update(
+    task_serializer="json",
+    accept_content=["json"],
+    result_serializer="json",
+    timezone="UTC",
+    enable_utc=True,
+    # Tasks are long (LLM calls, document rendering): ack after completion so a crash redelivers them.
+    # Under --autoscale Celery would prefetch max_concurrency * multiplier; QueueDepthAutoscaler caps it
+    # back to the current pool size so reserved-but-unstarted messages stay available to other workers.
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
+    worker_prefetch_multiplier=1,
+    broker_transport_options={"visibility_timeout": settings.CELERY_VISIBILITY_TIMEOUT},
+    worker_autoscaler="app.tasks.autoscale:QueueDepthAutoscaler",
+)
+
+# I/O-bound queues run on gevent workers, CPU-bound ones on prefork (see docker-compose.yml)
+celery_app.conf.task_queues = [
+    Queue("translation"),
+    Queue("discovery"),
+    Queue("rendering"),
+    Queue("maintenance"),
+]
+celery_app.conf.task_default_queue = "maintenance"
+
 celery_app.conf.task_routes = {
     "app.tasks.translation_tasks.*": {"queue": "translation"},
     "app.tasks.discovery_tasks.*": {"queue": "discovery"},
+    "app.tasks.rendering_tasks.*": {"queue": "rendering"},
+    "app.tasks.maintenance_tasks.*": {"queue": "maintenance"},
 }
+
+celery_app.conf.beat_schedule = {
+    "retention-daily": {
+        "task": "app.tasks.maintenance_tasks.run_retention",
+        "schedule": crontab(hour=3, minute=15),
+    },
+}
+
+import app.tasks.autoscale  # noqa: E402,F401  registers task latency signals
@@ -0,0 +1,50 @@
+import logging
+from datetime import datetime, timedelta, timezone
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.services.retention_service import (
+    PARTITIONED_TABLES,
+    add_months,
+    archive_discovery_results,
+    ensure_partitions,
+    rollup_credit_ledger,
+)
+from app.tasks.celery_app import celery_app
+
+logger = logging.getLogger(__name__)
+
+def _step(db, name: str, fn, default):
+    # Each step commits on its own; a failure is rolled back and logged so the others still run.
+    try:
+        return fn()
+    except Exception:
+        db.rollback()
+        logger.exception("Retention step %s failed", name)
+        return default
+
+@celery_app.task(name="app.tasks.maintenance_tasks.run_retention")
+def run_retention():
+    now = datetime.now(timezone.utc)
+    db = SessionLocal()
+    try:
+        created = []
+        for table in PARTITIONED_TABLES:
+            created += _step(
+                db, f"ensure_partitions:{table}",
+                lambda: ensure_partitions(db, table, settings.PARTITION_MONTHS_AHEAD), [],
+            )
+
+        opening_balances_written = _step(
+            db, "rollup_credit_ledger",
+            lambda: rollup_credit_ledger(db, add_months(now.date(), -settings.LEDGER_RETENTION_MONTHS)), None,
+        )
+        archived = _step(
+            db, "archive_discovery_results",
+            lambda: archive_discovery_results(
+                db, now - timedelta(days=settings.DISCOVERY_RESULT_HOT_DAYS), settings.ARCHIVE_BATCH_SIZE
+            ),
+            None,
+        )
+    finally:
+        db.close()
+    return {"partitions_created": created, "opening_balances_written": opening_balances_written, "archived_results": archived}
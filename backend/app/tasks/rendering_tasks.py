@@ -0,0 +1,5 @@
+from app.tasks.celery_app import celery_app
+
+@celery_app.task(name="app.tasks.rendering_tasks.ping")
+def ping():
+    return {"ok": True}
@@ -0,0 +1,152 @@
+from time import monotonic
+from types import SimpleNamespace
+import pytest
+from kombu.common import QoS
+from app.core.config import settings
+from app.tasks import autoscale
+from app.tasks.autoscale import QueueDepthAutoscaler
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.replies = []
+
+    def llen(self, queue):
+        self.replies.append(self.redis.depths.get(queue, 0))
+
+    def lrange(self, key, start, end):
+        self.replies.append(self.redis.latencies.get(key, []))
+
+    def execute(self):
+        return self.replies
+
+class FakeRedis:
+    def __init__(self):
+        self.depths = {}
+        self.latencies = {}
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+class PreforkPool:
+    def __init__(self, procs):
+        self.num_processes = procs
+
+    def grow(self, n=1):
+        self.num_processes += n
+
+    def shrink(self, n=1):
+        self.num_processes -= n
+
+    def maintain_pool(self):
+        pass
+
+class GeventPool(PreforkPool):
+    """Like celery's gevent TaskPool: num_processes counts running greenlets, capacity is _pool.size."""
+
+    def __init__(self, size, running):
+        self._pool = SimpleNamespace(size=size)
+        self.num_processes = running
+
+    def grow(self, n=1):
+        self._pool.size += n
+
+    def shrink(self, n=1):
+        self._pool.size -= n
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    r = FakeRedis()
+    monkeypatch.setattr(autoscale, "get_broker_redis", lambda: r)
+    monkeypatch.setattr(settings, "AUTOSCALE_SAMPLE_INTERVAL_SECONDS", 0.0)
+    monkeypatch.setattr(settings, "AUTOSCALE_TARGET_DRAIN_SECONDS", 60.0)
+    return r
+
+@pytest.fixture
+def reserved(monkeypatch):
+    count = {"n": 0}
+    monkeypatch.setattr(QueueDepthAutoscaler, "qty", property(lambda self: count["n"]))
+    return count
+
+def make_scaler(pool, max_concurrency=10, min_concurrency=1, prefetch=None, multiplier=1, queues=("translation",)):
+    consumer = SimpleNamespace(
+        qos=QoS(lambda v: None, prefetch if prefetch is not None else max_concurrency * multiplier),
+        prefetch_multiplier=multiplier,
+    )
+    worker = SimpleNamespace(
+        app=SimpleNamespace(amqp=SimpleNamespace(queues=SimpleNamespace(consume_from=dict.fromkeys(queues)))),
+        consumer=consumer,
+    )
+    scaler = QueueDepthAutoscaler(pool, max_concurrency, min_concurrency, worker=worker)
+    scaler._last_scale_up = monotonic() - 10 * scaler.keepalive  # allow scale-down in tests
+    return scaler
+
+def latency(queue, *seconds):
+    return {f"jurnallingua:latency:{queue}": [str(s).encode() for s in seconds]}
+
+def test_backlog_without_latency_is_one_slot_per_message(fake_redis, reserved):
+    fake_redis.depths["translation"] = 3
+    assert make_scaler(PreforkPool(1))._sample_backlog_target() == 3
+
+def test_backlog_scales_with_latency(fake_redis, reserved):
+    fake_redis.depths["translation"] = 12
+    fake_redis.latencies.update(latency("translation", 10, 20))  # mean 15s: 12 * 15 / 60 = 3 slots
+    assert make_scaler(PreforkPool(1))._sample_backlog_target() == 3
+
+def test_backlog_never_exceeds_depth(fake_redis, reserved):
+    fake_redis.depths["translation"] = 1
+    fake_redis.latencies.update(latency("translation", 600))  # ceil(1 * 600 / 60) = 10, capped at 1
+    assert make_scaler(PreforkPool(1))._sample_backlog_target() == 1
+
+def test_backlog_sums_all_consumed_queues(fake_redis, reserved):
+    fake_redis.depths.update({"rendering": 2, "maintenance": 1})
+    scaler = make_scaler(PreforkPool(1), queues=("rendering", "maintenance"))
+    assert scaler._sample_backlog_target() == 3
+
+def test_target_counts_reserved_plus_backlog(fake_redis, reserved):
+    reserved["n"] = 2
+    fake_redis.depths["translation"] = 3
+    pool = PreforkPool(1)
+    make_scaler(pool)._maybe_scale()
+    assert pool.num_processes == 5
+
+def test_target_clamped_to_max(fake_redis, reserved):
+    reserved["n"] = 4
+    fake_redis.depths["translation"] = 50
+    pool = PreforkPool(1)
+    make_scaler(pool, max_concurrency=6)._maybe_scale()
+    assert pool.num_processes == 6
+
+def test_target_clamped_to_min(fake_redis, reserved):
+    pool = PreforkPool(5)
+    make_scaler(pool, min_concurrency=2)._maybe_scale()
+    assert pool.num_processes == 2
+
+def test_prefetch_follows_pool_size_down(fake_redis, reserved):
+    fake_redis.depths["translation"] = 2
+    scaler = make_scaler(PreforkPool(1), max_concurrency=50, multiplier=2)
+    assert scaler.worker.consumer.qos.value == 100
+    scaler._maybe_scale()
+    assert scaler.processes == 2
+    assert scaler.worker.consumer.qos.value == 4
+
+def test_prefetch_follows_pool_size_up(fake_redis, reserved):
+    fake_redis.depths["translation"] = 8
+    scaler = make_scaler(PreforkPool(1), max_concurrency=50, prefetch=1)
+    scaler._maybe_scale()
+    assert scaler.processes == 8
+    assert scaler.worker.consumer.qos.value == 8
+
+def test_gevent_uses_pool_size_not_running_greenlets(fake_redis, reserved):
+    pool = GeventPool(size=4, running=1)
+    scaler = make_scaler(pool, max_concurrency=20, min_concurrency=4)
+    assert scaler.processes == 4
+    scaler._maybe_scale()  # empty queue, min 4: nothing to do even though only one greenlet runs
+    assert pool._pool.size == 4
+
+    fake_redis.depths["translation"] = 6
+    scaler._maybe_scale()
+    assert pool._pool.size == 6
+
+def test_prefork_falls_back_to_num_processes(fake_redis, reserved):
+    assert make_scaler(PreforkPool(3)).processes == 3
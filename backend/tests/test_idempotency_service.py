@@ -0,0 +1,119 @@
+import json
+import pytest
+from fastapi import HTTPException
+from app.core.config import settings
+from app.services import idempotency_service as idem
+
+class FakeRedis:
+    """In-memory stand-in for the subset of redis-py used by run_idempotent (TTLs ignored)."""
+
+    def __init__(self):
+        self.data = {}
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def eval(self, script, numkeys, key, token, *args):
+        cur = self.data.get(key)
+        if cur is None or json.loads(cur)["token"] != token:
+            return 0
+        if script == idem._RELEASE_SCRIPT:
+            del self.data[key]
+        elif script == idem._COMPLETE_SCRIPT:
+            self.data[key] = args[0]
+        else:
+            raise AssertionError("unknown script")
+        return 1
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    r = FakeRedis()
+    monkeypatch.setattr(idem, "get_redis", lambda: r)
+    monkeypatch.setattr(settings, "IDEMPOTENCY_WAIT_SECONDS", 0.02)
+    monkeypatch.setattr(settings, "IDEMPOTENCY_POLL_INTERVAL_SECONDS", 0.005)
+    return r
+
+REDIS_KEY = "idem:jobs.create:u1:k1"
+
+def _counting(response):
+    calls = []
+
+    def fn():
+        calls.append(1)
+        return response
+
+    return fn, calls
+
+def test_without_key_runs_fn_and_skips_fingerprint(fake_redis):
+    fn, calls = _counting({"ok": True})
+
+    def fingerprint():
+        raise AssertionError("fingerprint must not be computed without a key")
+
+    assert idem.run_idempotent("jobs.create", "u1", None, fingerprint, fn) == {"ok": True}
+    assert idem.run_idempotent("jobs.create", "u1", None, fingerprint, fn) == {"ok": True}
+    assert len(calls) == 2
+    assert fake_redis.data == {}
+
+def test_replays_stored_response(fake_redis):
+    fn, calls = _counting({"job_id": "j1"})
+    first = idem.run_idempotent("jobs.create", "u1", "k1", "fp", fn)
+    second = idem.run_idempotent("jobs.create", "u1", "k1", lambda: "fp", fn)
+    assert first == second == {"job_id": "j1"}
+    assert len(calls) == 1
+    assert json.loads(fake_redis.data[REDIS_KEY])["state"] == "done"
+
+def test_key_reused_with_different_request_is_422(fake_redis):
+    fn, _ = _counting({"job_id": "j1"})
+    idem.run_idempotent("jobs.create", "u1", "k1", "fp", fn)
+    with pytest.raises(HTTPException) as exc:
+        idem.run_idempotent("jobs.create", "u1", "k1", "other", fn)
+    assert exc.value.status_code == 422
+
+def test_failure_releases_key(fake_redis):
+    def boom():
+        raise RuntimeError("db down")
+
+    with pytest.raises(RuntimeError):
+        idem.run_idempotent("jobs.create", "u1", "k1", "fp", boom)
+    assert REDIS_KEY not in fake_redis.data
+
+    fn, calls = _counting({"job_id": "j2"})
+    assert idem.run_idempotent("jobs.create", "u1", "k1", "fp", fn) == {"job_id": "j2"}
+    assert len(calls) == 1
+
+def test_in_flight_duplicate_times_out_with_409(fake_redis):
+    fake_redis.data[REDIS_KEY] = json.dumps({"state": "pending", "fingerprint": "fp", "token": "other"})
+    fn, calls = _counting({"job_id": "j1"})
+    with pytest.raises(HTTPException) as exc:
+        idem.run_idempotent("jobs.create", "u1", "k1", "fp", fn)
+    assert exc.value.status_code == 409
+    assert calls == []
+
+def _take_over(fake_redis):
+    # Simulates the first claim expiring mid-request and a duplicate claiming the key
+    fake_redis.data[REDIS_KEY] = json.dumps({"state": "pending", "fingerprint": "fp", "token": "usurper"})
+
+def test_stale_owner_cannot_overwrite_new_claim(fake_redis):
+    def slow():
+        _take_over(fake_redis)
+        return {"job_id": "j1"}
+
+    assert idem.run_idempotent("jobs.create", "u1", "k1", "fp", slow) == {"job_id": "j1"}
+    record = json.loads(fake_redis.data[REDIS_KEY])
+    assert record == {"state": "pending", "fingerprint": "fp", "token": "usurper"}
+
+def test_stale_owner_cannot_release_new_claim(fake_redis):
+    def slow_then_fail():
+        _take_over(fake_redis)
+        raise RuntimeError("late failure")
+
+    with pytest.raises(RuntimeError):
+        idem.run_idempotent("jobs.create", "u1", "k1", "fp", slow_then_fail)
+    assert json.loads(fake_redis.data[REDIS_KEY])["token"] == "usurper"
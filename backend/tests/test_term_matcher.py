@@ -0,0 +1,38 @@
+from app.services.term_matcher import CompiledGlossary, TermMatcher
+
+def test_matches_whole_words_only():
+    m = TermMatcher(["he", "net"])
+    assert m.find("the network ushers") == set()
+    assert m.find("he said net, not network") == {0, 1}
+
+def test_overlapping_patterns():
+    m = TermMatcher(["neural network", "network", "work", "she", "he", "hers"])
+    assert m.find("a neural network") == {0, 1}
+    assert m.find("hers") == {5}
+    assert m.find("she and he") == {3, 4}
+
+def test_case_folding():
+    m = TermMatcher(["Neural Network", "C++"])
+    assert m.find("NEURAL network models in c++.") == {0, 1}
+
+def test_cjk_terms_match_without_word_boundaries():
+    m = TermMatcher(["深度学习"])
+    assert m.find("我们的深度学习模型") == {0}
+
+def test_terms_in_returns_glossary_order():
+    g = CompiledGlossary([("network", "jaringan"), ("neural", "saraf")])
+    assert g.terms_in("Neural network") == [("network", "jaringan"), ("neural", "saraf")]
+
+def test_missing_in_reports_absent_target_terms():
+    g = CompiledGlossary([("neural network", "jaringan saraf"), ("dataset", "set data"), ("model", "model")])
+    source = "The neural network was trained on the dataset."
+    assert g.missing_in(source, "Jaringan Saraf dilatih pada data.") == [("dataset", "set data")]
+    assert g.missing_in(source, "Jaringan saraf dilatih pada set data.") == []
+    assert g.missing_in("no terms here", "anything") == []
+
+def test_match_indices_reused_for_prompt_and_check():
+    g = CompiledGlossary([("neural network", "jaringan saraf"), ("dataset", "set data")])
+    required = g.match("A neural network and a dataset")
+    assert g.terms_for(required) == [("neural network", "jaringan saraf"), ("dataset", "set data")]
+    assert g.missing_for(required, "jaringan saraf dan data") == [("dataset", "set data")]
+    assert g.missing_for(set(), "anything") == []